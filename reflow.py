@@ -8,13 +8,15 @@ It preserves the structure, styling, and CMS content with advanced features.
 
 import os
 import re
+import sys
 import json
 import time
 import shutil
 import argparse
-import requests
 import logging
-from bs4 import BeautifulSoup
+import zipfile
+import threading
+from collections import deque
 from urllib.parse import urljoin, urlparse, unquote
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
@@ -27,8 +29,45 @@ logging.basicConfig(
 )
 logger = logging.getLogger('reflow')
 
+# Regular expressions used on every page, stylesheet and script, compiled once
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1F]')
+_BG_IMAGE_RE = re.compile(r'background-image\s*:\s*url\([\'"]?([^\'"]+)[\'"]?\)')
+_CSS_URL_RE = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+# Code that appends the Webflow badge to the page
+_BADGE_APPEND_RES = [re.compile(pattern) for pattern in (
+    r'\$\([^)]*\)\.append\(createBadge\(\)\);',
+    r'\$body\.append\(createBadge\(\)\);',
+    r'body\.appendChild\(createBadge\(\)\);',
+    r'document\.body\.appendChild\(createBadge\(\)\);'
+)]
+_WEBFLOW_JS_BADGE_APPEND_RES = [re.compile(pattern) for pattern in (
+    r'\$\([\'"]body[\'"]\)\.append\(createBadge\(\)\);',
+    r'\$body\.append\(createBadge\(\)\);',
+    r'body\.appendChild\(createBadge\(\)\);',
+    r'document\.body\.appendChild\(createBadge\(\)\);'
+)]
+_ANY_BADGE_APPEND_RE = re.compile(r'[\w$]+\.append\(createBadge\(\)\);')
+
+# Badge styles embedded in webflow.js
+_BADGE_CSS_RES = [re.compile(pattern) for pattern in (
+    r'\.w-webflow-badge\s*\{[^}]*\}',
+    r'\.w-webflow-badge:hover\s*\{[^}]*\}'
+)]
+
+# Connect and read timeouts for every request, so a stalled connection fails
+# instead of holding a worker and a pool slot indefinitely
+_REQUEST_TIMEOUT = (5, 30)
+
+# Formats that are already compressed, stored in the ZIP as-is since deflating
+# them again costs CPU for next to no saving
+_STORED_EXTENSIONS = frozenset((
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.ico',
+    '.woff', '.woff2', '.mp4', '.webm', '.mp3', '.zip', '.gz'
+))
+
 class Reflow:
-    def __init__(self, url, output_dir, max_workers=5, delay=0.2, process_cms=True, process_css=True, create_zip=True, log_level=logging.INFO, log_file=None):
+    def __init__(self, url, output_dir, max_workers=5, delay=0.2, process_cms=True, process_css=True, create_zip=True, log_level=logging.INFO, log_file=None, cancel_event=None, parser='lxml'):
         """
         Initialize the Reflow exporter.
         
@@ -42,14 +81,18 @@ class Reflow:
             create_zip (bool): Whether to create a ZIP archive
             log_level (int): Logging level (logging.DEBUG, INFO, ERROR)
             log_file (str): Path to log file (optional)
+            cancel_event (threading.Event): Event that stops the crawl when set (optional)
+            parser (str): BeautifulSoup tree builder for pages ('lxml' or 'html.parser')
         """
         self.base_url = url.rstrip('/')
         self.output_dir = output_dir
         self.max_workers = max_workers
         self.delay = delay
         self.process_cms = process_cms
-        self.process_css = not process_css  # Invert the logic since True now means retain original URLs
+        self.rewrite_css = not process_css  # Invert the logic since True now means retain original URLs
         self.create_zip = create_zip
+        self.cancel_event = cancel_event
+        self.parser = parser
         
         # Set up logging
         logger.setLevel(log_level)
@@ -58,19 +101,66 @@ class Reflow:
             file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
             logger.addHandler(file_handler)
         
+        # Imported here rather than at module level so that `--help` and the
+        # GUI's first paint don't pay for loading requests
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         
+        # The default pool keeps 10 connections per host, fewer than the page,
+        # asset and CSS workers can have open at once; connections beyond that
+        # are thrown away and each replacement costs a new TLS handshake.
+        # Transient server errors and rate limiting are retried with backoff.
+        adapter = HTTPAdapter(
+            pool_connections=max(max_workers, 10),
+            pool_maxsize=max(max_workers * 2, 20),
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         self.visited_urls = set()
-        self.assets_to_download = set()
+        self._visited_lock = threading.Lock()
+        self.assets_to_download = {}  # local path -> (URL, local path)
+        self._assets_lock = threading.Lock()
+        # Running totals for progress reporting, so callers don't need to
+        # reach into the collections above
+        self.n_pages = 0
+        self.n_assets = 0
         self.cms_pages = {}
         self.cms_collections = {}
+        # (collection ID, URL, slug) keys already recorded in cms_pages, kept
+        # outside it so the JSON dump is unchanged
+        self._cms_seen = set()
+        
+        # Relative path prefixes back to the site root, by directory depth
+        self._rel_root_cache = {}
+        
+        # Directories already created, so each is only created once
+        self._created_dirs = set()
+        self._dirs_lock = threading.Lock()
+        
+        # When each worker thread may next send a request
+        self._rate_state = threading.local()
+        
+        # Pool that downloaded stylesheets are rewritten on, while crawl_site
+        # is downloading assets
+        self._css_pool = None
         
         # Parse the domain from the URL
         parsed_url = urlparse(self.base_url)
         self.domain = parsed_url.netloc
+        # Prefixes of absolute links back into the site
+        self._site_prefixes = (f'https://{self.domain}/', f'http://{self.domain}/')
         
         # Determine the working directory
         if self.create_zip:
@@ -81,8 +171,9 @@ class Reflow:
             # If not creating a ZIP, use the output directory directly
             self.working_dir = output_dir
             
-        # Create working directory
-        os.makedirs(self.working_dir, exist_ok=True)
+        # Create working directory (through the cache, since root-level
+        # pages and assets are written straight into it)
+        self.ensure_dir(self.working_dir)
     
     def sanitize_filename(self, filename):
         """
@@ -99,8 +190,7 @@ class Reflow:
         
         # Replace problematic characters with underscores
         # This includes characters that are not allowed in filenames on various operating systems
-        invalid_chars = r'[<>:"/\\|?*\x00-\x1F]'
-        sanitized = re.sub(invalid_chars, '_', decoded_filename)
+        sanitized = _INVALID_FILENAME_CHARS_RE.sub('_', decoded_filename)
         
         # Replace spaces with underscores for better compatibility
         sanitized = sanitized.replace(' ', '_')
@@ -112,56 +202,206 @@ class Reflow:
             
         return sanitized
     
-    def download_page(self, url, output_path=None):
+    def relative_path_to_root(self, output_path):
+        """
+        Get the relative path prefix from a file in the working directory back
+        to the site root, e.g. '' for index.html or '../' for css/site.css.
+        
+        The prefix only depends on how deep the file is, so it is worked out
+        from the separator count and cached per depth.
+        
+        Args:
+            output_path (str): The path of the file inside the working directory
+            
+        Returns:
+            str: The relative path prefix, ending in '/' unless empty
+        """
+        relative = output_path[len(self.working_dir):]
+        if os.altsep:
+            relative = relative.replace(os.altsep, os.sep)
+        # Normalize first so empty or '.' segments (e.g. from a '/blog//post'
+        # link) don't count towards the depth
+        depth = os.path.normpath(relative.strip(os.sep)).count(os.sep)
+        
+        rel_path_to_root = self._rel_root_cache.get(depth)
+        if rel_path_to_root is None:
+            rel_path_to_root = self._rel_root_cache.setdefault(depth, '../' * depth)
+        return rel_path_to_root
+    
+    def resolve_asset_url(self, url, base_url):
+        """
+        Resolve an asset reference to an absolute URL and its filename.
+        
+        Absolute URLs without a query, fragment, path parameters or tabs and
+        newlines (which urlparse() removes), which is how Webflow references
+        its CDN assets, are split directly instead of going through urljoin()
+        and urlparse().
+        
+        Args:
+            url (str): The asset URL as it appears in the page or stylesheet
+            base_url (str): The URL of the page or stylesheet
+            
+        Returns:
+            tuple: (absolute URL, unsanitized filename)
+        """
+        if (url.startswith(('https://', 'http://')) and url.count('/') > 2
+                and '?' not in url and '#' not in url and ';' not in url and '/.' not in url
+                and '\t' not in url and '\r' not in url and '\n' not in url):
+            return url, url.rsplit('/', 1)[-1]
+        
+        absolute_url = urljoin(base_url, url)
+        path = urlparse(absolute_url).path.lstrip('/')
+        return absolute_url, os.path.basename(path)
+    
+    def resolve_link(self, href, base_url):
+        """
+        Resolve a link to the host and path it points at.
+        
+        Root-relative links and absolute links into the site, which make up
+        most navigation, are split directly; anything else, or anything with
+        dot segments, path parameters or tabs and newlines (which urlparse()
+        removes) to normalize, goes through urljoin() and urlparse().
+        
+        Args:
+            href (str): The link as it appears in the page
+            base_url (str): The URL of the page, on the site's domain
+            
+        Returns:
+            tuple: (netloc, path)
+        """
+        if ('/.' not in href and ';' not in href
+                and '\t' not in href and '\r' not in href and '\n' not in href):
+            if href.startswith('/') and not href.startswith('//'):
+                return self.domain, href.split('#', 1)[0].split('?', 1)[0]
+            for prefix in self._site_prefixes:
+                if href.startswith(prefix):
+                    return self.domain, href[len(prefix) - 1:].split('#', 1)[0].split('?', 1)[0]
+        
+        parsed_url = urlparse(urljoin(base_url, href))
+        return parsed_url.netloc, parsed_url.path
+    
+    def ensure_dir(self, directory):
+        """
+        Create a directory if it hasn't been created during this export yet.
+        
+        Args:
+            directory (str): The directory to create
+        """
+        with self._dirs_lock:
+            if directory not in self._created_dirs:
+                os.makedirs(directory, exist_ok=True)
+                self._created_dirs.add(directory)
+    
+    def queue_asset(self, url, local_path):
+        """
+        Queue an asset for download, keyed by its local path.
+        
+        The first URL seen for a local path wins, so the same file referenced
+        through different URLs (e.g. cache-busting query strings) is only
+        downloaded once.
+        
+        Args:
+            url (str): The absolute URL of the asset
+            local_path (str): The path to save the asset to, relative to the working directory
+        """
+        # Intern the strings so that repeated references to the same asset
+        # across pages hit the dict by identity rather than by comparison
+        local_path = sys.intern(local_path)
+        asset = (sys.intern(url), local_path)
+        # Stylesheets are processed on more than one thread at a time
+        with self._assets_lock:
+            if self.assets_to_download.setdefault(local_path, asset) is asset:
+                self.n_assets += 1
+    
+    def _throttle(self):
+        """
+        Space out requests to avoid rate limiting.
+        
+        Each worker waits until `delay` seconds after its previous request
+        before sending the next one. Time spent parsing or writing the last
+        response counts towards the delay, and a worker's final request is
+        not followed by a pointless sleep.
+        """
+        if self.delay <= 0:
+            return
+        
+        now = time.monotonic()
+        wait = getattr(self._rate_state, 'next_allowed', now) - now
+        if wait > 0:
+            time.sleep(wait)
+            now += wait
+        self._rate_state.next_allowed = now + self.delay
+    
+    def download_page(self, url, output_path=None, save_raw=False):
         """
         Download a page from the Webflow site.
         
         Args:
             url (str): The URL of the page to download
-            output_path (str, optional): The path to save the page to
+            output_path (str, optional): The path to save the unprocessed page to
+            save_raw (bool): Whether to save the unprocessed page to output_path
             
         Returns:
-            tuple: (BeautifulSoup object, HTML content)
+            tuple: (BeautifulSoup object, raw HTML bytes)
         """
-        if url in self.visited_urls:
-            return None, None
-        
-        self.visited_urls.add(url)
+        # Pages are fetched concurrently, so claim the URL under the lock
+        with self._visited_lock:
+            if url in self.visited_urls:
+                return None, None
+            self.visited_urls.add(sys.intern(url))
         
         try:
             # First try with the original URL
             logger.info(f"Downloading page: {url}")
-            response = self.session.get(url)
+            self._throttle()
+            response = self.session.get(url, timeout=_REQUEST_TIMEOUT)
             
             # If we get a 404 and the URL ends with .html, try without it
             if response.status_code == 404 and url.endswith('.html'):
                 url_without_html = url[:-5]  # Remove .html
                 logger.info(f"404 encountered, retrying without .html: {url_without_html}")
-                response = self.session.get(url_without_html)
+                self._throttle()
+                response = self.session.get(url_without_html, timeout=_REQUEST_TIMEOUT)
             
             response.raise_for_status()
             
-            # Add delay to avoid rate limiting
-            time.sleep(self.delay)
-            
-            # Ensure correct encoding detection
-            if response.encoding is None or response.encoding == 'ISO-8859-1':
-                # Try to detect encoding from content
-                response.encoding = response.apparent_encoding
-            
-            html_content = response.text
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            if output_path:
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                with open(output_path, 'w', encoding='utf-8') as f:
+            # Work on the raw bytes and let BeautifulSoup detect the encoding from
+            # the page's <meta charset>, rather than decoding via response.text
+            # only for the page to be re-encoded on save. A charset declared in
+            # the Content-Type header still takes precedence.
+            html_content = response.content
+            content_type = response.headers.get('Content-Type', '')
+            declared_encoding = response.encoding if 'charset' in content_type.lower() else None
+            
+            from bs4 import BeautifulSoup
+            # lxml (the default) builds the tree in C, which is several times
+            # faster than the pure-Python html.parser on large pages
+            soup = BeautifulSoup(html_content, self.parser, from_encoding=declared_encoding)
+            
+            if save_raw and output_path:
+                self.ensure_dir(os.path.dirname(output_path))
+                with open(output_path, 'wb') as f:
                     f.write(html_content)
             
+            with self._visited_lock:
+                self.n_pages += 1
             return soup, html_content
         except Exception as e:
             logger.error(f"Error downloading {url}: {e}")
             return None, None
     
+    def save_page(self, soup, output_path):
+        """
+        Save a processed page.
+        
+        Args:
+            soup (BeautifulSoup): The processed BeautifulSoup object of the page
+            output_path (str): The path to save the page to
+        """
+        self.ensure_dir(os.path.dirname(output_path))
+        with open(output_path, 'wb') as f:
+            f.write(soup.encode('utf-8'))
+    
     def remove_webflow_badge_from_html(self, soup):
         """
         Remove Webflow badge from HTML content.
@@ -216,6 +456,63 @@ class Reflow:
         
         return soup
     
+    def _rewrite_link(self, tag, base_url, rel_path_to_root, linked_pages):
+        """
+        Point a link into the site at the local copy of the page.
+        
+        Args:
+            tag (Tag): The <a> tag to rewrite
+            base_url (str): The base URL of the page
+            rel_path_to_root (str): The relative path from the page to the root
+            linked_pages (list): Site pages linked from the page, appended to
+                as paths relative to the site root
+        """
+        href = tag['href']
+        if href.startswith('#') or href.startswith('mailto:') or href.startswith('tel:'):
+            return
+        
+        # Handle file protocol URLs
+        if href.startswith('file:///'):
+            href = href.replace('file:///', '')
+            # Extract the path part after the drive letter or root
+            path_parts = href.split('/', 1)
+            if len(path_parts) > 1:
+                href = '/' + path_parts[1]
+            else:
+                href = '/'
+        
+        # Convert absolute URLs to relative paths
+        try:
+            netloc, path = self.resolve_link(href, base_url)
+        
+            # Only process links from the same domain or local file paths
+            if netloc == self.domain or not netloc:
+                if not path:
+                    path = '/'
+        
+                # Remove any domain prefix if present
+                if path.startswith(self.domain):
+                    path = path[len(self.domain):]
+        
+                # Ensure path starts with /
+                if not path.startswith('/'):
+                    path = '/' + path
+        
+                # Update href with relative path
+                if path == '/':
+                    tag['href'] = f"{rel_path_to_root}"
+                else:
+                    # Remove leading slash for relative path
+                    relative_path = path.lstrip('/')
+                    if relative_path.endswith('/'):
+                        relative_path = relative_path[:-1]
+                    if not relative_path.endswith('.html') and not '.' in os.path.basename(relative_path):
+                        relative_path += '.html'
+                    tag['href'] = f"{rel_path_to_root}{relative_path}"
+                    linked_pages.append(relative_path)
+        except Exception as e:
+            logger.warning(f"Error processing link {href}: {e}")
+    
     def process_html(self, soup, base_url, output_path):
         """
         Process HTML content to fix links and find assets to download.
@@ -226,197 +523,105 @@ class Reflow:
             output_path (str): The path where the page will be saved
             
         Returns:
-            BeautifulSoup: The processed BeautifulSoup object
+            tuple: (processed BeautifulSoup object, list of site pages linked
+                from the page, as paths relative to the site root)
         """
         # Remove Webflow badge from HTML
         soup = self.remove_webflow_badge_from_html(soup)
         
         # Get the relative path from the output file to the root
-        rel_path_to_root = os.path.relpath('/', os.path.dirname('/' + os.path.relpath(output_path, self.working_dir)))
-        if rel_path_to_root == '.':
-            rel_path_to_root = ''
-        elif not rel_path_to_root.endswith('/'):
-            rel_path_to_root += '/'
+        rel_path_to_root = self.relative_path_to_root(output_path)
         
         # Log the relative path for debugging
         logger.info(f"Relative path to root for {output_path}: {rel_path_to_root}")
         
-        # Process links
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
-            if href.startswith('#') or href.startswith('mailto:') or href.startswith('tel:'):
-                continue
-            
-            # Handle file protocol URLs
-            if href.startswith('file:///'):
-                href = href.replace('file:///', '')
-                # Extract the path part after the drive letter or root
-                path_parts = href.split('/', 1)
-                if len(path_parts) > 1:
-                    href = '/' + path_parts[1]
-                else:
-                    href = '/'
-            
-            # Convert absolute URLs to relative paths
-            try:
-                absolute_url = urljoin(base_url, href)
-                parsed_url = urlparse(absolute_url)
-                
-                # Only process links from the same domain or local file paths
-                if parsed_url.netloc == self.domain or not parsed_url.netloc:
-                    # Get the path component
-                    path = parsed_url.path
-                    if not path:
-                        path = '/'
-                    
-                    # Remove any domain prefix if present
-                    if path.startswith(self.domain):
-                        path = path[len(self.domain):]
-                    
-                    # Ensure path starts with /
-                    if not path.startswith('/'):
-                        path = '/' + path
-                    
-                    # Update href with relative path
-                    if path == '/':
-                        a_tag['href'] = f"{rel_path_to_root}"
-                    else:
-                        # Remove leading slash for relative path
-                        relative_path = path.lstrip('/')
-                        if relative_path.endswith('/'):
-                            relative_path = relative_path[:-1]
-                        if not relative_path.endswith('.html') and not '.' in os.path.basename(relative_path):
-                            relative_path += '.html'
-                        a_tag['href'] = f"{rel_path_to_root}{relative_path}"
-            except Exception as e:
-                logger.warning(f"Error processing link {href}: {e}")
-                continue
-        
-        # Process images
-        for img_tag in soup.find_all('img', src=True):
-            src = img_tag['src']
-            absolute_url = urljoin(base_url, src)
-            
-            # Skip Webflow badge images
-            if 'webflow-badge' in src:
-                img_tag.decompose()
-                continue
-            
-            # Extract path and filename
-            parsed_url = urlparse(absolute_url)
-            path = parsed_url.path.lstrip('/')
-            
-            # Sanitize the filename
-            sanitized_filename = self.sanitize_filename(os.path.basename(path))
-            
-            # Add to assets to download
-            self.assets_to_download.add((absolute_url, os.path.join('images', sanitized_filename)))
-            
-            # Update src attribute
-            img_tag['src'] = f"{rel_path_to_root}images/{sanitized_filename}"
-            
-            # Process srcset if it exists
-            if img_tag.get('srcset'):
-                srcset_parts = []
-                for srcset_part in img_tag['srcset'].split(','):
-                    src_parts = srcset_part.strip().split(' ')
-                    if len(src_parts) >= 1:
-                        src_url = src_parts[0]
-                        absolute_src_url = urljoin(base_url, src_url)
-                        parsed_src_url = urlparse(absolute_src_url)
-                        src_path = parsed_src_url.path.lstrip('/')
-                        
-                        # Sanitize the filename
-                        sanitized_src_filename = self.sanitize_filename(os.path.basename(src_path))
-                        
-                        # Add to assets to download
-                        self.assets_to_download.add((absolute_src_url, os.path.join('images', sanitized_src_filename)))
-                        
-                        # Update srcset part
-                        src_parts[0] = f"{rel_path_to_root}images/{sanitized_src_filename}"
-                        srcset_parts.append(' '.join(src_parts))
-                
-                img_tag['srcset'] = ', '.join(srcset_parts)
+        # The same asset is often referenced many times on a page (logos,
+        # icons, srcset candidates), so each distinct reference is resolved,
+        # sanitized and queued once and its local path reused
+        local_refs = {}
         
-        # Process CSS files
-        if self.process_css:
-            for link_tag in soup.find_all('link', rel='stylesheet', href=True):
-                href = link_tag['href']
-                absolute_url = urljoin(base_url, href)
-                
-                # Extract path and filename
-                parsed_url = urlparse(absolute_url)
-                path = parsed_url.path.lstrip('/')
-                
-                # Sanitize the filename
-                sanitized_filename = self.sanitize_filename(os.path.basename(path))
-                
-                # Add to assets to download
-                self.assets_to_download.add((absolute_url, os.path.join('css', sanitized_filename)))
-                
-                # Update href attribute
-                link_tag['href'] = f"{rel_path_to_root}css/{sanitized_filename}"
+        # Pages on this site that the page links to, collected while the
+        # links are rewritten so the crawl doesn't walk the anchors again
+        linked_pages = []
         
-        # Process JavaScript files
-        for script_tag in soup.find_all('script', src=True):
-            src = script_tag['src']
-            absolute_url = urljoin(base_url, src)
-            
-            # Extract path and filename
-            parsed_url = urlparse(absolute_url)
-            path = parsed_url.path.lstrip('/')
-            
-            # Sanitize the filename
-            sanitized_filename = self.sanitize_filename(os.path.basename(path))
-            
-            # Add to assets to download
-            self.assets_to_download.add((absolute_url, os.path.join('js', sanitized_filename)))
-            
-            # Update src attribute
-            script_tag['src'] = f"{rel_path_to_root}js/{sanitized_filename}"
-        
-        # Process inline styles with background images
-        for tag in soup.find_all(style=True):
-            style = tag['style']
-            # Find all background-image: url(...) patterns
-            bg_images = re.findall(r'background-image\s*:\s*url\([\'"]?([^\'"]+)[\'"]?\)', style)
-            for bg_image in bg_images:
-                absolute_url = urljoin(base_url, bg_image)
-                parsed_url = urlparse(absolute_url)
-                path = parsed_url.path.lstrip('/')
+        def localize(url, asset_dir):
+            key = (url, asset_dir)
+            local_ref = local_refs.get(key)
+            if local_ref is None:
+                # Extract URL and filename
+                absolute_url, filename = self.resolve_asset_url(url, base_url)
                 
                 # Sanitize the filename
-                sanitized_filename = self.sanitize_filename(os.path.basename(path))
+                sanitized_filename = self.sanitize_filename(filename)
                 
                 # Add to assets to download
-                self.assets_to_download.add((absolute_url, os.path.join('images', sanitized_filename)))
+                self.queue_asset(absolute_url, os.path.join(asset_dir, sanitized_filename))
                 
-                # Update style attribute
-                style = style.replace(bg_image, f"{rel_path_to_root}images/{sanitized_filename}")
-            
-            tag['style'] = style
+                local_ref = local_refs[key] = f"{rel_path_to_root}{asset_dir}/{sanitized_filename}"
+            return local_ref
         
-        # Process favicon
-        favicon_tags = soup.find_all('link', rel=['icon', 'shortcut icon'])
-        for favicon_tag in favicon_tags:
-            if 'href' in favicon_tag.attrs:
-                href = favicon_tag['href']
-                absolute_url = urljoin(base_url, href)
+        # Walk the tree once and dispatch on tag name, rather than running a
+        # separate find_all() traversal for each kind of tag
+        for tag in soup.find_all(True):
+            # Process links
+            if tag.name == 'a' and tag.get('href') is not None:
+                self._rewrite_link(tag, base_url, rel_path_to_root, linked_pages)
+            
+            # Process images
+            elif tag.name == 'img' and tag.get('src') is not None:
+                src = tag['src']
                 
-                # Extract path and filename
-                parsed_url = urlparse(absolute_url)
-                path = parsed_url.path.lstrip('/')
+                # Skip Webflow badge images
+                if 'webflow-badge' in src:
+                    tag.decompose()
+                    continue
                 
-                # Sanitize the filename
-                sanitized_filename = self.sanitize_filename(os.path.basename(path))
+                # Update src attribute
+                tag['src'] = localize(src, 'images')
                 
-                # Add to assets to download
-                self.assets_to_download.add((absolute_url, os.path.join('images', sanitized_filename)))
+                # Process srcset if it exists
+                if tag.get('srcset'):
+                    srcset_parts = []
+                    for srcset_part in tag['srcset'].split(','):
+                        src_parts = srcset_part.strip().split(' ')
+                        if len(src_parts) >= 1:
+                            # Update srcset part
+                            src_parts[0] = localize(src_parts[0], 'images')
+                            srcset_parts.append(' '.join(src_parts))
+                    
+                    tag['srcset'] = ', '.join(srcset_parts)
+            
+            # Process CSS files and favicons
+            elif tag.name == 'link' and tag.get('href') is not None:
+                rel = tag.get('rel') or []
+                if 'stylesheet' in rel and self.rewrite_css:
+                    asset_dir = 'css'
+                elif 'icon' in rel:
+                    asset_dir = 'images'
+                else:
+                    asset_dir = None
                 
-                # Update href attribute
-                favicon_tag['href'] = f"{rel_path_to_root}images/{sanitized_filename}"
+                if asset_dir:
+                    # Update href attribute
+                    tag['href'] = localize(tag['href'], asset_dir)
+            
+            # Process JavaScript files
+            elif tag.name == 'script' and tag.get('src') is not None:
+                # Update src attribute
+                tag['src'] = localize(tag['src'], 'js')
+            
+            # Process inline styles with background images
+            if tag.get('style') is not None:
+                style = tag['style']
+                # Find all background-image: url(...) patterns
+                bg_images = _BG_IMAGE_RE.findall(style)
+                for bg_image in bg_images:
+                    # Update style attribute
+                    style = style.replace(bg_image, localize(bg_image, 'images'))
+                
+                tag['style'] = style
         
-        return soup
+        return soup, linked_pages
     
     def process_css(self, css_content, base_url, css_path):
         """
@@ -430,47 +635,77 @@ class Reflow:
         Returns:
             str: The processed CSS content
         """
-        if not self.process_css:
+        if not self.rewrite_css:
             return css_content
             
         # Get the relative path from the CSS file to the root
-        rel_path_to_root = os.path.relpath('/', os.path.dirname('/' + os.path.relpath(css_path, self.working_dir)))
-        if rel_path_to_root == '.':
-            rel_path_to_root = ''
-        elif not rel_path_to_root.endswith('/'):
-            rel_path_to_root += '/'
+        rel_path_to_root = self.relative_path_to_root(css_path)
         
         # Log the relative path for debugging
         logger.info(f"CSS relative path to root for {css_path}: {rel_path_to_root}")
         
-        # Find all url(...) patterns
-        url_patterns = re.findall(r'url\([\'"]?([^\'"]+)[\'"]?\)', css_content)
-        for url_pattern in url_patterns:
-            # Skip data URLs
-            if url_pattern.startswith('data:'):
-                continue
+        def rewrite_url(match):
+            # An unquoted reference swallows any whitespace before the ')'
+            quote, url_pattern = match.group(1), match.group(2).strip()
+            
+            # Skip empty and data URLs
+            if not url_pattern or url_pattern.startswith('data:'):
+                return match.group(0)
             
             # Skip URLs with variables
             if '${' in url_pattern or '$(' in url_pattern:
-                continue
+                return match.group(0)
             
-            absolute_url = urljoin(base_url, url_pattern)
-            parsed_url = urlparse(absolute_url)
-            path = parsed_url.path.lstrip('/')
+            absolute_url, filename = self.resolve_asset_url(url_pattern, base_url)
             
             # Sanitize the filename
-            sanitized_filename = self.sanitize_filename(os.path.basename(path))
+            sanitized_filename = self.sanitize_filename(filename)
             
             # Add to assets to download
-            self.assets_to_download.add((absolute_url, os.path.join('images', sanitized_filename)))
+            self.queue_asset(absolute_url, os.path.join('images', sanitized_filename))
             
-            # Update URL in CSS
-            css_content = css_content.replace(f'url({url_pattern})', f'url({rel_path_to_root}images/{sanitized_filename})')
-            css_content = css_content.replace(f"url('{url_pattern}')", f"url('{rel_path_to_root}images/{sanitized_filename}')")
-            css_content = css_content.replace(f'url("{url_pattern}")', f'url("{rel_path_to_root}images/{sanitized_filename}")')
+            # Point the reference at the local copy, keeping its quoting
+            return f'url({quote}{rel_path_to_root}images/{sanitized_filename}{quote})'
+        
+        # Rewrite every url(...) in a single pass over the stylesheet, rather
+        # than rescanning the whole file for each URL found
+        css_content = _CSS_URL_RE.sub(rewrite_url, css_content)
         
         return css_content
     
+    def process_css_file(self, url, full_path, raw_data):
+        """
+        Decode a downloaded CSS file, fix its asset URLs and save it.
+        
+        Args:
+            url (str): The URL the CSS file was downloaded from
+            full_path (str): The path to save the processed CSS file to
+            raw_data (bytes): The downloaded CSS content
+        """
+        try:
+            try:
+                # First try UTF-8
+                css_content = raw_data.decode('utf-8')
+            except UnicodeDecodeError:
+                # If UTF-8 fails, try to detect encoding
+                import chardet
+                detected = chardet.detect(raw_data)
+                encoding = detected['encoding'] or 'utf-8'
+                css_content = raw_data.decode(encoding, errors='replace')
+            
+            processed_css = self.process_css(css_content, url, full_path)
+            
+            with open(full_path, 'w', encoding='utf-8') as f:
+                f.write(processed_css)
+        except Exception as e:
+            logger.error(f"Error processing CSS file {url}: {e}")
+            # The file was claimed empty when the download started; don't
+            # leave it behind for the next export to skip
+            try:
+                os.remove(full_path)
+            except OSError:
+                pass
+    
     def process_javascript(self, js_content):
         """
         Process JavaScript content to remove Webflow branding.
@@ -519,24 +754,12 @@ class Reflow:
             
             # 2. Remove any code that adds the badge to the page
             # Look for patterns like: $body.append(createBadge());
-            badge_append_patterns = [
-                r'\$\([^)]*\)\.append\(createBadge\(\)\);',
-                r'\$body\.append\(createBadge\(\)\);',
-                r'body\.appendChild\(createBadge\(\)\);',
-                r'document\.body\.appendChild\(createBadge\(\)\);'
-            ]
-            
-            for pattern in badge_append_patterns:
-                js_content = re.sub(pattern, '', js_content)
+            for pattern in _BADGE_APPEND_RES:
+                js_content = pattern.sub('', js_content)
             
             # 3. Remove any CSS related to the badge
-            badge_css_patterns = [
-                r'\.w-webflow-badge\s*\{[^}]*\}',
-                r'\.w-webflow-badge:hover\s*\{[^}]*\}'
-            ]
-            
-            for pattern in badge_css_patterns:
-                js_content = re.sub(pattern, '', js_content)
+            for pattern in _BADGE_CSS_RES:
+                js_content = pattern.sub('', js_content)
             
             # 4. Disable any code that might dynamically add the badge
             # Replace any remaining references to createBadge with an empty function
@@ -547,6 +770,15 @@ class Reflow:
         
         return js_content
     
+    def cancelled(self):
+        """
+        Check whether the crawl has been asked to stop.
+        
+        Returns:
+            bool: True if the cancel event has been set
+        """
+        return self.cancel_event is not None and self.cancel_event.is_set()
+    
     def download_asset(self, url_path_tuple):
         """
         Download an asset from the Webflow site.
@@ -554,60 +786,57 @@ class Reflow:
         Args:
             url_path_tuple (tuple): (URL, local path) of the asset to download
         """
+        # Let queued downloads drain quickly once the crawl is cancelled
+        if self.cancelled():
+            return
+        
         url, local_path = url_path_tuple
         full_path = os.path.join(self.working_dir, local_path)
         
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        self.ensure_dir(os.path.dirname(full_path))
+        
+        # Claim the file atomically before downloading. If it already exists,
+        # another worker or a previous export into the same directory got
+        # there first, and there is nothing to do.
+        try:
+            fd = os.open(full_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o644)
+        except FileExistsError:
+            logger.info(f"Asset already exists: {local_path}")
+            return
         
+        css_data = None
         try:
-            # Skip if file already exists
-            if os.path.exists(full_path):
-                logger.info(f"Asset already exists: {local_path}")
+            with os.fdopen(fd, 'wb') as f:
+                logger.info(f"Downloading asset: {url} to {local_path}")
+                self._throttle()
+                # Closing the response returns its connection to the pool as
+                # soon as the body has been read
+                with self.session.get(url, stream=True, timeout=_REQUEST_TIMEOUT) as response:
+                    response.raise_for_status()
+                    
+                    # Process CSS files if enabled
+                    if self.rewrite_css and local_path.startswith('css/') and local_path.endswith('.css'):
+                        css_data = response.content
+                    else:
+                        # Copy the body to disk in large blocks, undoing any gzip or
+                        # deflate transfer encoding on the way
+                        response.raw.decode_content = True
+                        shutil.copyfileobj(response.raw, f, 1024 * 1024)
+            
+            if css_data is not None:
+                # Hand the stylesheet straight from memory to the CSS pool so this
+                # worker can move on to its next download; the file is written
+                # once, after its URLs have been rewritten
+                if self._css_pool:
+                    self._css_pool.submit(self.process_css_file, url, full_path, css_data)
+                else:
+                    self.process_css_file(url, full_path, css_data)
                 return
             
-            logger.info(f"Downloading asset: {url} to {local_path}")
-            response = self.session.get(url, stream=True)
-            response.raise_for_status()
-            
-            # Ensure correct encoding detection for text-based assets
-            if not local_path.endswith(('.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.ico', '.ttf', '.woff', '.woff2', '.eot')):
-                # Try to detect encoding from content
-                if response.encoding is None or response.encoding == 'ISO-8859-1':
-                    response.encoding = response.apparent_encoding
-            
-            # Add delay to avoid rate limiting
-            time.sleep(self.delay)
-            
             # Special handling for webflow.js file
             is_webflow_js = 'webflow' in url.lower() and local_path.endswith('.js')
             
-            with open(full_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            # Process CSS files if enabled
-            if self.process_css and local_path.startswith('css/') and local_path.endswith('.css'):
-                try:
-                    # First try UTF-8
-                    with open(full_path, 'r', encoding='utf-8') as f:
-                        css_content = f.read()
-                except UnicodeDecodeError:
-                    # If UTF-8 fails, try to detect encoding
-                    import chardet
-                    with open(full_path, 'rb') as f:
-                        raw_data = f.read()
-                        detected = chardet.detect(raw_data)
-                        encoding = detected['encoding'] or 'utf-8'
-                    
-                    with open(full_path, 'r', encoding=encoding, errors='replace') as f:
-                        css_content = f.read()
-                
-                processed_css = self.process_css(css_content, url, full_path)
-                
-                with open(full_path, 'w', encoding='utf-8') as f:
-                    f.write(processed_css)
-            
             # Process JavaScript files
             if local_path.startswith('js/') and local_path.endswith('.js'):
                 with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
@@ -620,15 +849,8 @@ class Reflow:
                     js_content = js_content.replace("function createBadge()", "function createBadge() { return null; }")
                     
                     # Remove any code that appends the badge to the body
-                    badge_append_patterns = [
-                        r'\$\([\'"]body[\'"]\)\.append\(createBadge\(\)\);',
-                        r'\$body\.append\(createBadge\(\)\);',
-                        r'body\.appendChild\(createBadge\(\)\);',
-                        r'document\.body\.appendChild\(createBadge\(\)\);'
-                    ]
-                    
-                    for pattern in badge_append_patterns:
-                        js_content = re.sub(pattern, '', js_content)
+                    for pattern in _WEBFLOW_JS_BADGE_APPEND_RES + [_ANY_BADGE_APPEND_RE]:
+                        js_content = pattern.sub('', js_content)
                 
                 processed_js = self.process_javascript(js_content)
                 
@@ -637,6 +859,12 @@ class Reflow:
                 
         except Exception as e:
             logger.error(f"Error downloading {url}: {e}")
+            # Don't leave an empty or partial file behind, or the next export
+            # into this directory would skip the asset
+            try:
+                os.remove(full_path)
+            except OSError:
+                pass
     
     def detect_cms_collections(self, soup, url):
         """
@@ -666,7 +894,11 @@ class Reflow:
                 if collection_id not in self.cms_pages:
                     self.cms_pages[collection_id] = []
                 
-                if item_slug:
+                # A page can carry the same item more than once (and pages
+                # can be re-processed), so skip entries already recorded
+                key = (collection_id, url, item_slug)
+                if item_slug and key not in self._cms_seen:
+                    self._cms_seen.add(key)
                     self.cms_pages[collection_id].append({
                         'url': url,
                         'slug': item_slug
@@ -733,6 +965,107 @@ class Reflow:
         
         return cms_paths
     
+    def save_json(self, data, path):
+        """
+        Save data as indented JSON.
+        
+        orjson is used when it's installed, as it serializes large CMS
+        collections several times faster than the standard library and
+        writes bytes directly; otherwise this falls back to json.
+        
+        Args:
+            data (dict): The data to save
+            path (str): The path to save the JSON file to
+        """
+        try:
+            import orjson
+        except ImportError:
+            # Write non-ASCII text as UTF-8, as orjson does, so the output
+            # doesn't depend on which library is installed
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        else:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    
+    def write_zip(self, zip_path):
+        """
+        Archive the working directory into a ZIP file.
+        
+        Text files are deflated at a low compression level, which gets most of
+        the saving for a fraction of the CPU time; already-compressed images,
+        fonts and media are stored without compression.
+        
+        Args:
+            zip_path (str): The path of the ZIP file to create
+        """
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+            for root, dirs, files in os.walk(self.working_dir):
+                for file in files:
+                    full_path = os.path.join(root, file)
+                    arcname = os.path.relpath(full_path, self.working_dir)
+                    if os.path.splitext(file)[1].lower() in _STORED_EXTENSIONS:
+                        archive.write(full_path, arcname, compress_type=zipfile.ZIP_STORED)
+                    else:
+                        archive.write(full_path, arcname)
+    
+    def crawl_pages(self, pages, detect_cms=True):
+        """
+        Download pages concurrently, then process and save each one as it arrives.
+        
+        Fetching and parsing run on the worker pool; rewriting and saving stay
+        on the calling thread, so the asset queue and CMS info are only ever
+        updated from one thread. Results are taken in the order the pages were
+        given, which keeps the exported CMS info stable between runs.
+        
+        Args:
+            pages (list): (URL, output path) tuples of the pages to crawl
+            detect_cms (bool): Whether to look for CMS collections on each page
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Keep only a couple of pages per worker in flight, so finished
+            # pages waiting for their turn don't pile up in memory
+            pending_pages = iter(pages)
+            in_flight = deque()
+            
+            def submit_next():
+                for url, output_path in pending_pages:
+                    in_flight.append((executor.submit(self.download_page, url), url, output_path))
+                    return
+            
+            for _ in range(self.max_workers * 2):
+                submit_next()
+            
+            while in_flight:
+                if self.cancelled():
+                    # Drop the pages that haven't started yet
+                    for pending, _, _ in in_flight:
+                        pending.cancel()
+                    break
+                
+                future, url, output_path = in_flight.popleft()
+                submit_next()
+                
+                soup, _ = future.result()
+                if soup:
+                    # Process the page
+                    soup, linked_pages = self.process_html(soup, url, output_path)
+                    
+                    # Save the processed page
+                    self.save_page(soup, output_path)
+                    
+                    # Detect CMS collections
+                    if detect_cms:
+                        self.detect_cms_collections(soup, url)
+    
+    def _abort_crawl(self):
+        """
+        Stop a cancelled crawl, discarding the temporary working directory.
+        """
+        logger.info("Export cancelled")
+        if self.working_dir != self.output_dir and os.path.exists(self.working_dir):
+            shutil.rmtree(self.working_dir)
+    
     def crawl_site(self):
         """
         Crawl the Webflow site and download all pages and assets.
@@ -741,135 +1074,77 @@ class Reflow:
             logger.info(f"Starting crawl of {self.base_url}")
             
             # Download the homepage
-            soup, html_content = self.download_page(self.base_url, os.path.join(self.working_dir, 'index.html'))
+            soup, html_content = self.download_page(self.base_url)
             if not soup:
                 logger.error("Failed to download homepage. Exiting.")
                 return
             
             # Process the homepage
-            soup = self.process_html(soup, self.base_url, os.path.join(self.working_dir, 'index.html'))
+            soup, linked_pages = self.process_html(soup, self.base_url, os.path.join(self.working_dir, 'index.html'))
             
             # Save the processed homepage
-            with open(os.path.join(self.working_dir, 'index.html'), 'w', encoding='utf-8') as f:
-                f.write(str(soup))
+            self.save_page(soup, os.path.join(self.working_dir, 'index.html'))
             
             # Detect CMS collections
             self.detect_cms_collections(soup, self.base_url)
             
-            # Find all links on the homepage
+            # Queue the pages the homepage links to. Navigation usually links the
+            # same page several times, so each URL is only queued once.
             links_to_crawl = []
-            for a_tag in soup.find_all('a', href=True):
-                href = a_tag['href']
-                if href.startswith('#') or href.startswith('mailto:') or href.startswith('tel:'):
-                    continue
-                    
-                absolute_url = urljoin(self.base_url, href)
-                parsed_url = urlparse(absolute_url)
-                
-                # Only process links from the same domain
-                if parsed_url.netloc == self.domain:
-                    path = parsed_url.path
-                    if not path:
-                        path = '/'
-                    
-                    # Skip the homepage since we already processed it
-                    if path == '/':
-                        continue
-                    
-                    # Determine output path
-                    if path.endswith('/'):
-                        output_path = os.path.join(self.working_dir, path.lstrip('/'), 'index.html')
-                    else:
-                        # Check if it's a file or directory
-                        if '.' in os.path.basename(path):
-                            output_path = os.path.join(self.working_dir, path.lstrip('/'))
-                        else:
-                            output_path = os.path.join(self.working_dir, path.lstrip('/'), 'index.html')
-                    
-                    links_to_crawl.append((absolute_url, output_path))
+            enqueued = {self.base_url}
+            for relative_path in linked_pages:
+                absolute_url = urljoin(self.base_url, relative_path)
+                if absolute_url not in enqueued:
+                    enqueued.add(absolute_url)
+                    links_to_crawl.append((absolute_url, os.path.join(self.working_dir, relative_path)))
             
             # Crawl all links
-            for url, output_path in links_to_crawl:
-                soup, html_content = self.download_page(url, output_path)
-                if soup:
-                    # Process the page
-                    soup = self.process_html(soup, url, output_path)
-                    
-                    # Save the processed page
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        f.write(str(soup))
-                    
-                    # Detect CMS collections
-                    self.detect_cms_collections(soup, url)
+            self.crawl_pages(links_to_crawl, detect_cms=True)
             
             # Process CMS pages if enabled
-            if self.process_cms:
+            if self.process_cms and not self.cancelled():
                 cms_paths = self.extract_cms_paths()
                 logger.info(f"Found {len(cms_paths)} CMS pages to crawl")
                 
-                for url, output_path in cms_paths:
-                    soup, html_content = self.download_page(url, output_path)
-                    if soup:
-                        # Process the page
-                        soup = self.process_html(soup, url, output_path)
-                        
-                        # Save the processed page
-                        with open(output_path, 'w', encoding='utf-8') as f:
-                            f.write(str(soup))
+                self.crawl_pages(cms_paths, detect_cms=False)
+            
+            if self.cancelled():
+                self._abort_crawl()
+                return
             
             # Download all assets
             if self.assets_to_download:
                 logger.info(f"Downloading {len(self.assets_to_download)} assets...")
+                queued_paths = set(self.assets_to_download)
+                
+                # Stylesheets are rewritten on their own small pool so that CSS
+                # processing doesn't hold up the download workers
+                self._css_pool = ThreadPoolExecutor(max_workers=2)
                 with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                    executor.map(self.download_asset, self.assets_to_download)
-            
-            # Post-processing: Final pass to ensure all webflow.js files are properly modified
-            logger.info("Performing final pass to remove Webflow badge...")
-            for root, dirs, files in os.walk(self.working_dir):
-                for file in files:
-                    if file.lower().startswith('webflow') and file.lower().endswith('.js'):
-                        js_path = os.path.join(root, file)
-                        logger.info(f"Final pass: Processing {js_path}")
-                        try:
-                            with open(js_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                js_content = f.read()
-                            
-                            # Direct replacement of badge code
-                            if 'function createBadge()' in js_content:
-                                logger.info(f"Found createBadge function in {file}, replacing with empty function")
-                                js_content = js_content.replace(
-                                    "function createBadge()",
-                                    "function createBadge() { return null; }"
-                                )
-                                
-                                # Also remove any code that appends the badge
-                                badge_append_patterns = [
-                                    r'\$\([\'"]body[\'"]\)\.append\(createBadge\(\)\);',
-                                    r'\$body\.append\(createBadge\(\)\);',
-                                    r'body\.appendChild\(createBadge\(\)\);',
-                                    r'document\.body\.appendChild\(createBadge\(\)\);',
-                                    r'[\w$]+\.append\(createBadge\(\)\);'
-                                ]
-                                
-                                for pattern in badge_append_patterns:
-                                    js_content = re.sub(pattern, '', js_content)
-                                
-                                with open(js_path, 'w', encoding='utf-8') as f:
-                                    f.write(js_content)
-                        except Exception as e:
-                            logger.error(f"Error processing {js_path}: {e}")
+                    executor.map(self.download_asset, list(self.assets_to_download.values()))
+                self._css_pool.shutdown(wait=True)
+                self._css_pool = None
+                
+                # Download the assets referenced from the stylesheets
+                css_assets = [asset for path, asset in self.assets_to_download.items() if path not in queued_paths]
+                if css_assets and not self.cancelled():
+                    logger.info(f"Downloading {len(css_assets)} assets referenced from CSS...")
+                    with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                        executor.map(self.download_asset, css_assets)
+            
+            if self.cancelled():
+                self._abort_crawl()
+                return
             
             # Save CMS pages info if enabled
             if self.process_cms and self.cms_pages:
-                with open(os.path.join(self.working_dir, 'cms_pages.json'), 'w', encoding='utf-8') as f:
-                    json.dump(self.cms_pages, f, indent=2)
+                self.save_json(self.cms_pages, os.path.join(self.working_dir, 'cms_pages.json'))
                 
                 logger.info(f"Saved CMS pages info to {os.path.join(self.working_dir, 'cms_pages.json')}")
             
             # Save CMS collections info if enabled
             if self.process_cms and self.cms_collections:
-                with open(os.path.join(self.working_dir, 'cms_collections.json'), 'w', encoding='utf-8') as f:
-                    json.dump(self.cms_collections, f, indent=2)
+                self.save_json(self.cms_collections, os.path.join(self.working_dir, 'cms_collections.json'))
                 
                 logger.info(f"Saved CMS collections info to {os.path.join(self.working_dir, 'cms_collections.json')}")
             
@@ -880,11 +1155,7 @@ class Reflow:
                 
                 try:
                     # Create ZIP archive directly
-                    shutil.make_archive(
-                        os.path.splitext(zip_path)[0],
-                        'zip',
-                        self.working_dir
-                    )
+                    self.write_zip(zip_path)
                     logger.info(f"ZIP archive created at: {zip_path}")
                 except Exception as e:
                     logger.error(f"Error creating ZIP archive: {e}")
@@ -915,6 +1186,7 @@ def main():
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
     parser.add_argument('--quiet', '-q', action='store_true', help='Suppress all output except errors')
     parser.add_argument('--log-file', help='Save logs to a file')
+    parser.add_argument('--parser', choices=['lxml', 'html.parser'], default='lxml', help='HTML parser to use (html.parser needs no lxml install)')
     
     args = parser.parse_args()
     
@@ -936,7 +1208,8 @@ def main():
         process_css=not args.no_css,
         create_zip=not args.no_zip,
         log_level=log_level,
-        log_file=args.log_file
+        log_file=args.log_file,
+        parser=args.parser
     )
     exporter.crawl_site()
 
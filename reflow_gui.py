@@ -1,53 +1,115 @@
+import re
 import tkinter as tk
 import customtkinter as ctk
 from tkinter import scrolledtext, filedialog
+import queue
+from collections import namedtuple
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import webbrowser
 from urllib.parse import urlparse
 import os
 import sys
 import logging
-from reflow import Reflow
+
+# An http(s) scheme followed by a host
+_URL_RE = re.compile(r'^https?://[^/\s]+')
+
+# Export settings, read from the widgets on the main thread when an export
+# starts so the worker never touches Tk
+ExportConfig = namedtuple('ExportConfig', ['url', 'output_dir', 'workers', 'delay', 'cms', 'css', 'zip'])
+
+class QueueLogHandler(logging.Handler):
+    """Forward log records to the GUI's update queue"""
+    # Only puts to the queue, which is safe from any thread; the main loop
+    # picks the lines up in batches, so no Tk calls happen here
+    def __init__(self, log_queue):
+        super().__init__()
+        self.log_queue = log_queue
+
+    def emit(self, record):
+        try:
+            self.log_queue.put(("log", self.format(record) + "\n"))
+        except Exception:
+            self.handleError(record)
 
 class ToolTip(object):
     """Create a tooltip for a given widget"""
-    def __init__(self, widget, text=''):
+    # One tooltip window is shared by every ToolTip and only shown, moved and
+    # hidden, rather than creating and destroying a Toplevel on every hover
+    _shared_tip = None
+    _shared_label = None
+
+    def __init__(self, widget, text='', delay=400):
         self.widget = widget
         self.text = text
-        self.tooltip = None
+        self.delay = delay
+        self._after_id = None
         self.widget.bind('<Enter>', self.enter)
         self.widget.bind('<Leave>', self.leave)
 
     def enter(self, event=None):
-        x, y, _, _ = self.widget.bbox("insert")
-        x += self.widget.winfo_rootx() + 25
-        y += self.widget.winfo_rooty() + 25
-        
-        # Create top level window
-        self.tooltip = tk.Toplevel(self.widget)
-        # Remove window decorations
-        self.tooltip.wm_overrideredirect(True)
-        self.tooltip.wm_geometry(f"+{x}+{y}")
-        
-        # Create tooltip label
-        label = tk.Label(
-            self.tooltip,
-            text=self.text,
-            justify=tk.LEFT,
-            background="#2b2b2b",
-            foreground="#ffffff",
-            relief=tk.SOLID,
-            borderwidth=1,
-            font=("Segoe UI", 9)
-        )
-        label.pack()
+        # Only show the tooltip once the pointer has dwelt on the widget, so
+        # quick mouse transits don't touch the window at all
+        self._after_id = self.widget.after(self.delay, self._show)
+
+    @classmethod
+    def _ensure_shared_tip(cls, widget):
+        if cls._shared_tip is None:
+            # Create top level window
+            cls._shared_tip = tk.Toplevel(widget.winfo_toplevel())
+            # Remove window decorations
+            cls._shared_tip.wm_overrideredirect(True)
+            cls._shared_tip.withdraw()
+            
+            # Create tooltip label
+            cls._shared_label = tk.Label(
+                cls._shared_tip,
+                justify=tk.LEFT,
+                background="#2b2b2b",
+                foreground="#ffffff",
+                relief=tk.SOLID,
+                borderwidth=1,
+                font=("Segoe UI", 9)
+            )
+            cls._shared_label.pack()
+        return cls._shared_tip
+
+    def _show(self):
+        self._after_id = None
+        # Place the tip relative to the widget itself. CTk widgets are frames,
+        # where bbox("insert") is a grid query that fails rather than a cursor
+        # position, so the tooltip never appeared.
+        x = self.widget.winfo_rootx() + 25
+        y = self.widget.winfo_rooty() + 25
+        
+        tip = self._ensure_shared_tip(self.widget)
+        ToolTip._shared_label.configure(text=self.text)
+        tip.wm_geometry(f"+{x}+{y}")
+        tip.deiconify()
 
     def leave(self, event=None):
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        if self._after_id:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        if ToolTip._shared_tip is not None:
+            ToolTip._shared_tip.withdraw()
 
 class ReflowGUI:
+    # Oldest lines are trimmed from the progress log beyond this many
+    MAX_LOG_LINES = 5000
+
+    # Font specs and colors shared by every widget
+    HEADER_FONT = ("Segoe UI", 13, "bold")
+    LABEL_FONT = ("Segoe UI", 11)
+    BUTTON_FONT = ("Segoe UI", 11)
+    SMALL_FONT = ("Segoe UI", 10)
+    EXPORT_BUTTON_FONT = ("Segoe UI", 12, "bold")
+    LOG_FONT = ("Consolas", 10)
+    SECTION_COLOR = ("gray85", "gray17")
+    ACCENT_COLOR = "#1f6aaa"
+    ACCENT_HOVER_COLOR = "#1c5c94"
+
     def __init__(self):
         """Initialize the GUI"""
         self.root = ctk.CTk()
@@ -55,16 +117,18 @@ class ReflowGUI:
         self.root.geometry("800x700")
         self.root.minsize(800, 700)
         
+        # Font objects need a root window, so they're made here, once, and
+        # every widget shares them rather than resolving its own font tuple
+        self.header_font = ctk.CTkFont(*self.HEADER_FONT)
+        self.label_font = ctk.CTkFont(*self.LABEL_FONT)
+        self.button_font = ctk.CTkFont(*self.BUTTON_FONT)
+        self.small_font = ctk.CTkFont(*self.SMALL_FONT)
+        self.export_button_font = ctk.CTkFont(*self.EXPORT_BUTTON_FONT)
+        
         # Configure the appearance
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
         
-        # Configure fonts
-        self.header_font = ("Segoe UI", 13, "bold")
-        self.label_font = ("Segoe UI", 11)
-        self.button_font = ("Segoe UI", 11)
-        self.small_font = ("Segoe UI", 10)
-        
         # URL Input Frame
         url_frame = ctk.CTkFrame(self.root, corner_radius=0)
         url_frame.pack(fill=tk.X, padx=15, pady=(15, 10))
@@ -89,20 +153,12 @@ class ReflowGUI:
         # Add tooltip for URL entry
         ToolTip(self.url_entry, "Enter the URL of your Webflow site\nExample: https://your-site.webflow.io")
         
-        # Settings frame
+        # Settings frame. It is packed once its sections are built, so the
+        # window lays it out in one pass rather than after every child.
         settings_frame = ctk.CTkFrame(self.root, corner_radius=0)
-        settings_frame.pack(fill=tk.X, padx=15, pady=(0, 10))
         
         # Output Directory
-        output_section = ctk.CTkFrame(settings_frame, fg_color=("gray85", "gray17"), corner_radius=0)
-        output_section.pack(fill=tk.X, padx=8, pady=8)
-        
-        output_label = ctk.CTkLabel(
-            output_section,
-            text="Export Location",
-            font=self.header_font
-        )
-        output_label.pack(anchor=tk.W, padx=10, pady=(8, 5))
+        output_section = self._build_section(settings_frame, "Export Location")
         
         output_subframe = ctk.CTkFrame(output_section, fg_color="transparent", corner_radius=0)
         output_subframe.pack(fill=tk.X, padx=10, pady=(0, 8))
@@ -115,6 +171,8 @@ class ReflowGUI:
             corner_radius=0
         )
         self.output_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        # Folder the browse dialogs open in; worked out on first use
+        self._last_dir = None
         
         # Add tooltip for output entry
         ToolTip(self.output_entry, "Choose where to save the exported site\nWill be a ZIP file or folder depending on settings")
@@ -131,138 +189,73 @@ class ReflowGUI:
         browse_button.pack(side=tk.LEFT)
         
         # Processing Options
-        processing_section = ctk.CTkFrame(settings_frame, fg_color=("gray85", "gray17"), corner_radius=0)
-        processing_section.pack(fill=tk.X, padx=8, pady=8)
-        
-        processing_label = ctk.CTkLabel(
-            processing_section,
-            text="Processing Options",
-            font=self.header_font
-        )
-        processing_label.pack(anchor=tk.W, padx=10, pady=(8, 5))
+        processing_section = self._build_section(settings_frame, "Processing Options")
         
         # Horizontal layout for processing options
         options_frame = ctk.CTkFrame(processing_section, fg_color="transparent", corner_radius=0)
         options_frame.pack(fill=tk.X, padx=10, pady=(0, 8))
         
         self.cms_var = tk.BooleanVar(value=True)
-        cms_check = ctk.CTkCheckBox(
+        self._build_option(
             options_frame,
-            text="Process CMS Collections",
-            variable=self.cms_var,
-            font=self.label_font,
-            border_width=1,
-            corner_radius=0,
-            hover_color="#1f6aaa"
+            "Process CMS Collections",
+            self.cms_var,
+            "Enable to process and download CMS collection pages\nRequired if your site uses dynamic collections"
         )
-        cms_check.pack(side=tk.LEFT, padx=10, pady=2)
-        ToolTip(cms_check, "Enable to process and download CMS collection pages\nRequired if your site uses dynamic collections")
         
         self.css_var = tk.BooleanVar(value=False)
-        css_check = ctk.CTkCheckBox(
+        self._build_option(
             options_frame,
-            text="Retain Original Asset URLs",
-            variable=self.css_var,
-            font=self.label_font,
-            border_width=1,
-            corner_radius=0,
-            hover_color="#1f6aaa"
+            "Retain Original Asset URLs",
+            self.css_var,
+            "Keep original URLs for assets in CSS files\nEnable if you want assets to load from Webflow servers"
         )
-        css_check.pack(side=tk.LEFT, padx=10, pady=2)
-        ToolTip(css_check, "Keep original URLs for assets in CSS files\nEnable if you want assets to load from Webflow servers")
         
         self.zip_var = tk.BooleanVar(value=True)
-        zip_check = ctk.CTkCheckBox(
+        self._build_option(
             options_frame,
-            text="Create ZIP Archive",
-            variable=self.zip_var,
-            command=self.toggle_zip_mode,
-            font=self.label_font,
-            border_width=1,
-            corner_radius=0,
-            hover_color="#1f6aaa"
+            "Create ZIP Archive",
+            self.zip_var,
+            "Create a ZIP file containing the exported site\nRecommended for easier file handling",
+            command=self.toggle_zip_mode
         )
-        zip_check.pack(side=tk.LEFT, padx=10, pady=2)
-        ToolTip(zip_check, "Create a ZIP file containing the exported site\nRecommended for easier file handling")
         
         # Performance Settings
-        perf_section = ctk.CTkFrame(settings_frame, fg_color=("gray85", "gray17"), corner_radius=0)
-        perf_section.pack(fill=tk.X, padx=8, pady=8)
+        perf_section = self._build_section(settings_frame, "Performance Settings")
         
-        perf_label = ctk.CTkLabel(
-            perf_section,
-            text="Performance Settings",
-            font=self.header_font
-        )
-        perf_label.pack(anchor=tk.W, padx=10, pady=(8, 5))
+        # Slider values waiting to be shown, applied together when Tk is idle
+        self._slider_values = {}
+        self._slider_after_id = None
         
         # Workers slider
-        workers_frame = ctk.CTkFrame(perf_section, fg_color="transparent", corner_radius=0)
-        workers_frame.pack(fill=tk.X, padx=10, pady=(0, 8))
-        
-        workers_label = ctk.CTkLabel(
-            workers_frame,
-            text="Max Workers:",
-            font=self.label_font
-        )
-        workers_label.pack(side=tk.LEFT, padx=5)
-        
-        self.workers_value = tk.StringVar(value="5")
-        self.workers_slider = ctk.CTkSlider(
-            workers_frame,
+        self._workers_text = "16"
+        self.workers_slider, self.workers_value_label = self._build_slider_row(
+            perf_section,
+            "Max Workers:",
+            'workers',
             from_=5,
-            to=20,
-            number_of_steps=15,
-            command=lambda v: self.workers_value.set(str(int(v))),
-            width=200,
-            height=16,
-            corner_radius=0,
-            border_width=1
-        )
-        self.workers_slider.pack(side=tk.LEFT, padx=10)
-        self.workers_slider.set(5)
-        ToolTip(self.workers_slider, "Number of concurrent downloads\nMore workers = faster export but higher server load\nDefault: 5, Max: 20")
-        
-        workers_value_label = ctk.CTkLabel(
-            workers_frame,
-            textvariable=self.workers_value,
-            font=self.label_font
+            to=32,
+            steps=27,
+            value=16,
+            value_text=self._workers_text,
+            tooltip="Number of concurrent downloads\nMore workers = faster export but higher server load\nDefault: 16, Max: 32"
         )
-        workers_value_label.pack(side=tk.LEFT)
         
         # Delay slider
-        delay_frame = ctk.CTkFrame(perf_section, fg_color="transparent", corner_radius=0)
-        delay_frame.pack(fill=tk.X, padx=10, pady=(0, 8))
-        
-        delay_label = ctk.CTkLabel(
-            delay_frame,
-            text="Request Delay (s):",
-            font=self.label_font
-        )
-        delay_label.pack(side=tk.LEFT, padx=5)
-        
-        self.delay_value = tk.StringVar(value="0.2")
-        self.delay_slider = ctk.CTkSlider(
-            delay_frame,
+        self._delay_text = "0.2"
+        self.delay_slider, self.delay_value_label = self._build_slider_row(
+            perf_section,
+            "Request Delay (s):",
+            'delay',
             from_=0.2,
             to=2.0,
-            number_of_steps=18,
-            command=lambda v: self.delay_value.set(f"{v:.1f}"),
-            width=200,
-            height=16,
-            corner_radius=0,
-            border_width=1
+            steps=18,
+            value=0.2,
+            value_text=self._delay_text,
+            tooltip="Delay between requests in seconds\nLonger delay = slower export but more polite\nDefault: 0.2s, Max: 2.0s"
         )
-        self.delay_slider.pack(side=tk.LEFT, padx=10)
-        self.delay_slider.set(0.2)
-        ToolTip(self.delay_slider, "Delay between requests in seconds\nLonger delay = slower export but more polite\nDefault: 0.2s, Max: 2.0s")
         
-        delay_value_label = ctk.CTkLabel(
-            delay_frame,
-            textvariable=self.delay_value,
-            font=self.label_font
-        )
-        delay_value_label.pack(side=tk.LEFT)
+        settings_frame.pack(fill=tk.X, padx=15, pady=(0, 10))
         
         # Export button
         self.export_button = ctk.CTkButton(
@@ -270,11 +263,11 @@ class ReflowGUI:
             text="Export Site",
             command=self.start_export,
             height=32,
-            font=("Segoe UI", 12, "bold"),
+            font=self.export_button_font,
             corner_radius=0,
             border_width=0,
-            fg_color="#1f6aaa",
-            hover_color="#1c5c94"
+            fg_color=self.ACCENT_COLOR,
+            hover_color=self.ACCENT_HOVER_COLOR
         )
         self.export_button.pack(pady=(5, 15), padx=15)
         
@@ -292,16 +285,16 @@ class ReflowGUI:
         self.preview_frame = ctk.CTkFrame(self.root, corner_radius=0)
         self.preview_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 10))
         
-        self.preview_text = scrolledtext.ScrolledText(
+        # The log widget is built on first use; until then a lightweight
+        # placeholder stands in for it
+        self.preview_text = None
+        self.preview_placeholder = ctk.CTkLabel(
             self.preview_frame,
-            wrap=tk.WORD,
-            height=10,
-            bg='#1a1a1a',
-            fg='#e6e6e6',
-            font=("Consolas", 10),
-            border=0
+            text="Export progress will appear here",
+            font=self.small_font,
+            text_color="gray"
         )
-        self.preview_text.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
+        self.preview_placeholder.pack(expand=True)
         
         # Status bar
         status_frame = ctk.CTkFrame(self.root, fg_color="transparent", corner_radius=0, height=25)
@@ -315,103 +308,348 @@ class ReflowGUI:
         )
         self.status_label.pack(side=tk.LEFT)
         
+        # Tkinter isn't thread-safe, so the export thread posts its updates
+        # here and the main loop applies them. The queue is only polled while
+        # an export is running, so an idle window never wakes up.
+        self.log_queue = queue.Queue()
+        
+        # Show the exporter's own progress messages in the log as well
+        self._logger = logging.getLogger('reflow')
+        self._log_handler = QueueLogHandler(self.log_queue)
+        self._log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S'))
+        self._logger.addHandler(self._log_handler)
+        
+        # A single long-lived worker runs exports, instead of a new thread
+        # per click
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reflow-export")
+        self._future = None
+        
+        # Set to ask a running export to stop at its next checkpoint
+        self._cancel_event = threading.Event()
+        
+        # Stop any running export when the window is closed, so the process
+        # doesn't linger waiting on the worker thread
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+    def _build_section(self, parent, title):
+        """Build a settings section with a header label"""
+        section = ctk.CTkFrame(parent, fg_color=self.SECTION_COLOR, corner_radius=0)
+        section.pack(fill=tk.X, padx=8, pady=8)
+        
+        header = ctk.CTkLabel(
+            section,
+            text=title,
+            font=self.header_font
+        )
+        header.pack(anchor=tk.W, padx=10, pady=(8, 5))
+        return section
+        
+    def _build_option(self, parent, text, variable, tooltip, command=None):
+        """Build a processing option checkbox"""
+        check = ctk.CTkCheckBox(
+            parent,
+            text=text,
+            variable=variable,
+            command=command,
+            font=self.label_font,
+            border_width=1,
+            corner_radius=0,
+            hover_color=self.ACCENT_COLOR
+        )
+        check.pack(side=tk.LEFT, padx=10, pady=2)
+        ToolTip(check, tooltip)
+        return check
+        
+    def _build_slider_row(self, parent, label, name, from_, to, steps, value, value_text, tooltip):
+        """Build a labelled slider with a readout of its value"""
+        row = ctk.CTkFrame(parent, fg_color="transparent", corner_radius=0)
+        row.pack(fill=tk.X, padx=10, pady=(0, 8))
+        
+        row_label = ctk.CTkLabel(
+            row,
+            text=label,
+            font=self.label_font
+        )
+        row_label.pack(side=tk.LEFT, padx=5)
+        
+        slider = ctk.CTkSlider(
+            row,
+            from_=from_,
+            to=to,
+            number_of_steps=steps,
+            command=lambda new_value: self._queue_slider_update(name, new_value),
+            width=200,
+            height=16,
+            corner_radius=0,
+            border_width=1
+        )
+        slider.pack(side=tk.LEFT, padx=10)
+        slider.set(value)
+        ToolTip(slider, tooltip)
+        
+        value_label = ctk.CTkLabel(
+            row,
+            text=value_text,
+            font=self.label_font
+        )
+        value_label.pack(side=tk.LEFT)
+        return slider, value_label
+        
+    def _ensure_preview(self):
+        """Build the progress log widget the first time it's needed"""
+        if self.preview_text is None:
+            self.preview_placeholder.destroy()
+            
+            self.preview_text = scrolledtext.ScrolledText(
+                self.preview_frame,
+                wrap=tk.CHAR,
+                height=10,
+                bg='#1a1a1a',
+                fg='#e6e6e6',
+                font=self.LOG_FONT,
+                border=0,
+                undo=False,
+                maxundo=0
+            )
+            self.preview_text.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
+            # The log is append-only; keep it read-only so the user can't edit it
+            self.preview_text.configure(state='disabled')
+        return self.preview_text
+        
+    def _append_log(self, text, clear=False):
+        """Write a batch of text to the progress log in a single edit"""
+        preview = self._ensure_preview()
+        # Only follow new output if the user hasn't scrolled up to read
+        follow = clear or preview.yview()[1] > 0.995
+        preview.configure(state='normal')
+        if clear:
+            preview.delete('1.0', tk.END)
+        preview.insert(tk.END, text)
+        self._trim_log()
+        
+        # Scroll once per batch, then lock the widget again
+        if follow:
+            preview.see(tk.END)
+        preview.configure(state='disabled')
+        
+    def _trim_log(self):
+        """Drop the oldest lines so the log stays bounded on long exports"""
+        line_count = int(self.preview_text.index('end-1c').split('.')[0])
+        if line_count > self.MAX_LOG_LINES:
+            self.preview_text.delete('1.0', f'{line_count - self.MAX_LOG_LINES + 1}.0')
+        
+    def _drain_log(self):
+        """Apply updates posted by the export thread, on the main thread"""
+        # Coalesce everything logged since the last tick into a single insert
+        # rather than one Tcl round trip per line
+        log_parts = []
+        export_done = False
+        while True:
+            try:
+                kind, value = self.log_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "log":
+                log_parts.append(value)
+            elif kind == "done":
+                self.status_label.configure(text="Ready")
+                self.export_button.configure(text="Export Site", command=self.start_export, state="normal")
+                export_done = True
+        
+        if log_parts:
+            self._append_log("".join(log_parts))
+        
+        if not export_done:
+            self.root.after(50, self._drain_log)
+        
+    def _queue_slider_update(self, name, value):
+        # Sliders fire on every pixel of a drag; just remember the latest
+        # value and update the readouts once per idle cycle
+        self._slider_values[name] = value
+        if self._slider_after_id is None:
+            self._slider_after_id = self.root.after_idle(self._flush_slider_updates)
+        
+    def _flush_slider_updates(self):
+        self._slider_after_id = None
+        values, self._slider_values = self._slider_values, {}
+        
+        # Only touch a label when the displayed value actually changes
+        if 'workers' in values:
+            text = str(int(values['workers']))
+            if text != self._workers_text:
+                self._workers_text = text
+                self.workers_value_label.configure(text=text)
+        if 'delay' in values:
+            text = f"{values['delay']:.1f}"
+            if text != self._delay_text:
+                self._delay_text = text
+                self.delay_value_label.configure(text=text)
+        
     def toggle_zip_mode(self):
-        if self.zip_var.get():
-            if not self.output_entry.get().endswith('.zip'):
-                current = self.output_entry.get().rstrip('/')
-                self.output_entry.delete(0, tk.END)
-                self.output_entry.insert(0, current + '.zip')
+        # Read the entry once, and leave it alone if it's empty or already
+        # has the right suffix
+        current = self.output_entry.get()
+        want_zip = self.zip_var.get()
+        if not current or current.endswith('.zip') == want_zip:
+            return
+        
+        if want_zip:
+            new_path = current.rstrip('/') + '.zip'
         else:
-            if self.output_entry.get().endswith('.zip'):
-                current = self.output_entry.get()[:-4]
-                self.output_entry.delete(0, tk.END)
-                self.output_entry.insert(0, current)
+            new_path = current[:-4]
+        self.output_entry.delete(0, tk.END)
+        self.output_entry.insert(0, new_path)
     
+    @staticmethod
+    def _domain_slug(url):
+        """Name an export after the site's domain, e.g. my-site for my-site.webflow.io"""
+        if not _URL_RE.match(url):
+            return "webflow_export"
+        # hostname drops any port, which isn't valid in a Windows filename
+        host = urlparse(url).hostname or ""
+        return host.removesuffix('.webflow.io') or "webflow_export"
+        
     def browse_output_directory(self):
+        if self._last_dir is None:
+            # Start in the user's Downloads folder, falling back to their home
+            home = os.path.expanduser("~")
+            downloads = os.path.join(home, "Downloads")
+            self._last_dir = downloads if os.path.isdir(downloads) else home
+        
         if self.zip_var.get():
             filename = filedialog.asksaveasfilename(
+                parent=self.root,
                 title="Save Export As",
                 defaultextension=".zip",
                 filetypes=[("ZIP archives", "*.zip"), ("All files", "*.*")],
-                initialfile="webflow_export.zip"
+                initialdir=self._last_dir,
+                initialfile=f"{self._domain_slug(self.url_entry.get().strip())}.zip"
             )
         else:
             filename = filedialog.askdirectory(
+                parent=self.root,
                 title="Select Export Location",
-                initialdir=os.path.abspath(self.output_entry.get())
+                initialdir=self._last_dir,
+                mustexist=False
             )
         if filename:
             self.output_entry.delete(0, tk.END)
             self.output_entry.insert(0, filename)
+            # Reopen the dialog where the user left off next time
+            self._last_dir = os.path.dirname(filename) if self.zip_var.get() else filename
         
     def start_export(self):
         url = self.url_entry.get().strip()
         if not url:
-            self.preview_text.insert(tk.END, "Error: Please enter a valid Webflow URL\n")
+            self._append_log("Error: Please enter a valid Webflow URL\n")
             return
             
-        try:
-            parsed_url = urlparse(url)
-            if not parsed_url.scheme or not parsed_url.netloc:
-                raise ValueError("Invalid URL format")
-        except ValueError:
-            self.preview_text.insert(tk.END, "Error: Invalid URL format. Please include http:// or https://\n")
+        if not _URL_RE.match(url):
+            self._append_log("Error: Invalid URL format. Please include http:// or https://\n")
             return
             
         # Validate output directory
         output_dir = self.output_entry.get().strip()
         if not output_dir:
-            self.preview_text.insert(tk.END, "Error: Please select an export location\n")
+            self._append_log("Error: Please select an export location\n")
             return
             
         # Clear preview area
-        self.preview_text.delete(1.0, tk.END)
-        self.preview_text.insert(tk.END, f"Starting export of {url}...\n")
-        self.preview_text.insert(tk.END, f"Export location: {output_dir}\n")
+        self._append_log(
+            f"Starting export of {url}...\n"
+            f"Export location: {output_dir}\n",
+            clear=True
+        )
         self.status_label.configure(text="Exporting...")
+        
+        # The export button becomes the cancel button while the export runs
+        self._cancel_event.clear()
+        self.export_button.configure(text="Cancel", command=self.cancel_export)
+        
+        # Snapshot the settings for the worker
+        config = ExportConfig(
+            url=url,
+            output_dir=output_dir,
+            workers=min(int(float(self._workers_text)), 32),
+            delay=float(self._delay_text),
+            cms=self.cms_var.get(),
+            css=self.css_var.get(),
+            zip=self.zip_var.get()
+        )
+        
+        # Start export on the worker thread. The done callback runs on that
+        # thread too, so it goes through the queue; it fires however
+        # run_export exits.
+        self._future = self._executor.submit(self.run_export, config)
+        self._future.add_done_callback(lambda future: self.log_queue.put(("done", None)))
+        self.root.after(50, self._drain_log)
+        
+    def cancel_export(self):
+        """Ask the running export to stop"""
+        self._cancel_event.set()
+        self.status_label.configure(text="Cancelling...")
         self.export_button.configure(state="disabled")
         
-        # Start export in a separate thread
-        thread = threading.Thread(target=self.run_export, args=(url,))
-        thread.daemon = True
-        thread.start()
+    def _on_close(self):
+        """Cancel any running export, then close the window"""
+        self._cancel_event.set()
+        # Nothing drains the queue once the window is gone
+        self._logger.removeHandler(self._log_handler)
+        self.root.destroy()
         
-    def run_export(self, url):
+    def run_export(self, config):
+        output_dir = config.output_dir
         try:
-            # Get settings from GUI
-            output_dir = self.output_entry.get().strip()
-            workers = int(float(self.workers_value.get()))
-            delay = float(self.delay_value.get())
+            # Check the export location is writable up front. This runs on the
+            # worker thread, so a slow network share doesn't stall the window.
+            probe_dir = os.path.dirname(os.path.abspath(output_dir))
+            while not os.path.isdir(probe_dir) and os.path.dirname(probe_dir) != probe_dir:
+                probe_dir = os.path.dirname(probe_dir)
+            probe = os.path.join(probe_dir, '.reflow_probe')
+            try:
+                open(probe, 'wb').close()
+                os.unlink(probe)
+            except OSError as e:
+                self.log_queue.put(("log", f"Error: Cannot write to {output_dir}: {e}\n"))
+                return
+            
+            # Imported here, on the worker thread, so the window doesn't wait on
+            # the exporter's dependencies before first appearing
+            from reflow import Reflow
             
             # Create and run the exporter
             exporter = Reflow(
-                url,
+                config.url,
                 output_dir,
-                max_workers=workers,
-                delay=delay,
-                process_cms=self.cms_var.get(),
-                process_css=self.css_var.get(),
-                create_zip=self.zip_var.get(),
-                log_level=logging.INFO  # Always use normal logging
+                max_workers=config.workers,
+                delay=config.delay,
+                process_cms=config.cms,
+                process_css=config.css,
+                create_zip=config.zip,
+                log_level=logging.INFO,  # Always use normal logging
+                cancel_event=self._cancel_event
             )
             
             # Start the export
             exporter.crawl_site()
             
-            self.preview_text.insert(tk.END, "\nExport completed successfully!\n")
+            if self._cancel_event.is_set():
+                self.log_queue.put(("log", "\nExport cancelled.\n"))
+                return
             
-            # Print summary
-            self.preview_text.insert(tk.END, "\nExport Summary:\n")
-            self.preview_text.insert(tk.END, f"- Pages downloaded: {len(exporter.visited_urls)}\n")
-            self.preview_text.insert(tk.END, f"- Assets downloaded: {len(exporter.assets_to_download)}\n")
+            # Print summary as a single message
+            summary = (
+                "\nExport completed successfully!\n"
+                "\nExport Summary:\n"
+                f"- Pages downloaded: {exporter.n_pages}\n"
+                f"- Assets downloaded: {exporter.n_assets}\n"
+            )
             if hasattr(exporter, 'cms_pages'):
-                self.preview_text.insert(tk.END, f"- CMS collections detected: {len(exporter.cms_pages)}\n")
+                summary += f"- CMS collections detected: {len(exporter.cms_pages)}\n"
+            self.log_queue.put(("log", summary))
             
         except Exception as e:
-            self.preview_text.insert(tk.END, f"Error during export: {str(e)}\n")
-        finally:
-            self.status_label.configure(text="Ready")
-            self.export_button.configure(state="normal")
+            self.log_queue.put(("log", f"Error during export: {str(e)}\n"))
             
     def run(self):
         self.root.mainloop()